@@ -157,11 +157,9 @@ def get_learner_fn(
             env_state, timestep = jax.vmap(env.step, in_axes=(0, 0))(env_state, action)
 
             # LOG EPISODE METRICS
-            done = jax.tree_util.tree_map(
-                lambda x: jnp.repeat(x, config["system"]["num_agents"]).reshape(
-                    config["arch"]["num_envs"], -1
-                ),
-                timestep.last(),
+            done = jnp.broadcast_to(
+                timestep.last()[:, jnp.newaxis],
+                (config["arch"]["num_envs"], config["system"]["num_agents"]),
             )
             info = {
                 "episode_return": env_state.episode_return_info,
@@ -188,6 +186,9 @@ def get_learner_fn(
         ) -> Tuple[chex.Array, chex.Array]:
             """Calculate the GAE."""
 
+            gamma = config["system"]["gamma"]
+            gae_lambda = config["system"]["gae_lambda"]
+
             def _get_advantages(gae_and_next_value: Tuple, transition: PPOTransition) -> Tuple:
                 """Calculate the GAE for a single transition."""
                 gae, next_value = gae_and_next_value
@@ -196,9 +197,9 @@ def get_learner_fn(
                     transition.value,
                     transition.reward,
                 )
-                gamma = config["system"]["gamma"]
-                delta = reward + gamma * next_value * (1 - done) - value
-                gae = delta + gamma * config["system"]["gae_lambda"] * (1 - done) * gae
+                discount = gamma * (1 - done)
+                delta = reward + discount * next_value - value
+                gae = delta + discount * gae_lambda * gae
                 return (gae, value), gae
 
             _, advantages = jax.lax.scan(
@@ -520,7 +521,7 @@ def learner_setup(
     rng, *env_rngs = jax.random.split(
         rng, n_devices * config["system"]["update_batch_size"] * config["arch"]["num_envs"] + 1
     )
-    env_states, timesteps = jax.vmap(env.reset, in_axes=(0))(
+    env_states, timesteps = jax.jit(jax.vmap(env.reset, in_axes=(0)))(
         jnp.stack(env_rngs),
     )
 
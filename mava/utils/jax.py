@@ -14,6 +14,8 @@
 
 # TODO: Rewrite this file to handle only JAX arrays.
 
+import math
+
 import chex
 import jax
 import jax.numpy as jnp
@@ -40,5 +42,5 @@ def merge_leading_dims(x: chex.Array, num_dims: chex.Numeric) -> chex.Array:
     if not ndim_at_least(x, num_dims):
         return x
 
-    new_shape = (np.prod(x.shape[:num_dims]),) + x.shape[num_dims:]
+    new_shape = (math.prod(x.shape[:num_dims]),) + x.shape[num_dims:]
     return x.reshape(new_shape)
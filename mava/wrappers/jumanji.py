@@ -31,6 +31,8 @@ class MultiAgentWrapper(Wrapper):
         super().__init__(env)
         self._num_agents = self._env.num_agents
         self.time_limit = self._env.time_limit
+        # The spec only depends on the wrapped environment, so build it once.
+        self._observation_spec = self._make_observation_spec()
 
     def modify_timestep(self, timestep: TimeStep) -> TimeStep[Observation]:
         """Modify the timestep for `step` and `reset`."""
@@ -46,17 +48,17 @@ class MultiAgentWrapper(Wrapper):
         state, timestep = self._env.step(state, action)
         return state, self.modify_timestep(timestep)
 
-    def observation_spec(self) -> specs.Spec[Observation]:
-        """Specification of the observation of the environment."""
+    def _make_observation_spec(self) -> specs.Spec[Observation]:
+        """Build the observation spec with a per-agent step count."""
         step_count = specs.BoundedArray(
-            (self._num_agents,),
-            jnp.int32,
-            [0] * self._num_agents,
-            [self.time_limit] * self._num_agents,
-            "step_count",
+            (self._num_agents,), jnp.int32, 0, self.time_limit, "step_count"
         )
         return self._env.observation_spec().replace(step_count=step_count)
 
+    def observation_spec(self) -> specs.Spec[Observation]:
+        """Specification of the observation of the environment."""
+        return self._observation_spec
+
 
 class RwareWrapper(MultiAgentWrapper):
     """Multi-agent wrapper for the Robotic Warehouse environment."""
@@ -69,10 +71,10 @@ class RwareWrapper(MultiAgentWrapper):
         observation = Observation(
             agents_view=timestep.observation.agents_view,
             action_mask=timestep.observation.action_mask,
-            step_count=jnp.repeat(timestep.observation.step_count, self._num_agents),
+            step_count=jnp.broadcast_to(timestep.observation.step_count, (self._num_agents,)),
         )
-        reward = jnp.repeat(timestep.reward, self._num_agents)
-        discount = jnp.repeat(timestep.discount, self._num_agents)
+        reward = jnp.broadcast_to(timestep.reward, (self._num_agents,))
+        discount = jnp.broadcast_to(timestep.discount, (self._num_agents,))
         return timestep.replace(observation=observation, reward=reward, discount=discount)
 
 
@@ -97,8 +99,8 @@ class LbfWrapper(MultiAgentWrapper):
         """Aggregate individual rewards across agents."""
         team_reward = jnp.sum(timestep.reward)
 
-        # Repeat the aggregated reward for each agent.
-        reward = jnp.repeat(team_reward, self._num_agents)
+        # Broadcast the aggregated reward to each agent.
+        reward = jnp.broadcast_to(team_reward, (self._num_agents,))
         return timestep.replace(observation=observation, reward=reward)
 
     def modify_timestep(self, timestep: TimeStep) -> TimeStep[Observation]:
@@ -109,7 +111,7 @@ class LbfWrapper(MultiAgentWrapper):
         modified_observation = Observation(
             agents_view=timestep.observation.agents_view,
             action_mask=timestep.observation.action_mask,
-            step_count=jnp.repeat(timestep.observation.step_count, self._num_agents),
+            step_count=jnp.broadcast_to(timestep.observation.step_count, (self._num_agents,)),
         )
         if self._use_individual_rewards:
             # The environment returns a list of individual rewards and these are used as is.
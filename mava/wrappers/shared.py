@@ -27,10 +27,21 @@ from mava.types import LogEnvState, Observation, ObservationGlobalState, State
 class LogWrapper(Wrapper):
     """Log the episode returns and lengths."""
 
+    def __init__(self, env: Environment):
+        super().__init__(env)
+        # Constant used to average the per-agent rewards on every step.
+        self._inv_num_agents = 1.0 / self._env.num_agents
+
     def reset(self, key: chex.PRNGKey) -> Tuple[LogEnvState, TimeStep]:
         """Reset the environment."""
         state, timestep = self._env.reset(key)
-        state = LogEnvState(state, jnp.float32(0.0), 0, jnp.float32(0.0), 0)
+        state = LogEnvState(
+            env_state=state,
+            episode_returns=jnp.float32(0.0),
+            episode_lengths=jnp.int32(0),
+            episode_return_info=jnp.float32(0.0),
+            episode_length_info=jnp.int32(0),
+        )
         return state, timestep
 
     def step(
@@ -42,19 +53,18 @@ class LogWrapper(Wrapper):
         env_state, timestep = self._env.step(state.env_state, action)
 
         done = timestep.last()
-        not_done = 1 - done
 
-        new_episode_return = state.episode_returns + jnp.mean(timestep.reward)
-        new_episode_length = state.episode_lengths + 1
-        episode_return_info = state.episode_return_info * not_done + new_episode_return * done
-        episode_length_info = state.episode_length_info * not_done + new_episode_length * done
+        new_episode_return = state.episode_returns + jnp.sum(timestep.reward) * self._inv_num_agents
+        new_episode_length = state.episode_lengths + jnp.int32(1)
 
+        # Select on the done flag rather than masking with multiply-adds: each counter
+        # update lowers to a single XLA select and keeps its dtype.
         state = LogEnvState(
             env_state=env_state,
-            episode_returns=new_episode_return * not_done,
-            episode_lengths=new_episode_length * not_done,
-            episode_return_info=episode_return_info,
-            episode_length_info=episode_length_info,
+            episode_returns=jnp.where(done, jnp.float32(0.0), new_episode_return),
+            episode_lengths=jnp.where(done, jnp.int32(0), new_episode_length),
+            episode_return_info=jnp.where(done, new_episode_return, state.episode_return_info),
+            episode_length_info=jnp.where(done, new_episode_length, state.episode_length_info),
         )
         return state, timestep
 
@@ -95,9 +105,9 @@ class AgentIDWrapper(Wrapper):
     def reset(self, key: chex.PRNGKey) -> Tuple[State, TimeStep]:
         """Reset the environment."""
         state, timestep = self._env.reset(key)
-        timestep.observation = self._add_agent_ids(timestep, self._env.num_agents)
+        observation = self._add_agent_ids(timestep, self._env.num_agents)
 
-        return state, timestep
+        return state, timestep.replace(observation=observation)
 
     def step(
         self,
@@ -106,9 +116,9 @@ class AgentIDWrapper(Wrapper):
     ) -> Tuple[State, TimeStep]:
         """Step the environment."""
         state, timestep = self._env.step(state, action)
-        timestep.observation = self._add_agent_ids(timestep, self._env.num_agents)
+        observation = self._add_agent_ids(timestep, self._env.num_agents)
 
-        return state, timestep
+        return state, timestep.replace(observation=observation)
 
     def observation_spec(
         self,
@@ -142,8 +152,13 @@ class GlobalStateWrapper(Wrapper):
     by concatenating the observations of all agents.
     """
 
+    def __init__(self, env: Environment):
+        super().__init__(env)
+        # The spec only depends on the wrapped environment, so build it once.
+        self._observation_spec = self._make_observation_spec()
+
     def modify_timestep(self, timestep: TimeStep) -> TimeStep[ObservationGlobalState]:
-        global_state = jnp.concatenate(timestep.observation.agents_view, axis=0)
+        global_state = timestep.observation.agents_view.reshape(-1)
         global_state = jnp.tile(global_state, (self._env.num_agents, 1))
 
         observation = ObservationGlobalState(
@@ -165,9 +180,8 @@ class GlobalStateWrapper(Wrapper):
         state, timestep = self._env.step(state, action)
         return state, self.modify_timestep(timestep)
 
-    def observation_spec(self) -> specs.Spec[ObservationGlobalState]:
-        """Specification of the observation of the `RobotWarehouse` environment."""
-
+    def _make_observation_spec(self) -> specs.Spec[ObservationGlobalState]:
+        """Build the observation spec with the added global state."""
         obs_spec = self._env.observation_spec()
         num_obs_features = obs_spec.agents_view.shape[-1]
         global_state = specs.Array(
@@ -184,3 +198,7 @@ class GlobalStateWrapper(Wrapper):
             global_state=global_state,
             step_count=obs_spec.step_count,
         )
+
+    def observation_spec(self) -> specs.Spec[ObservationGlobalState]:
+        """Specification of the observation of the `RobotWarehouse` environment."""
+        return self._observation_spec